@@ -1,5 +1,10 @@
 #!/usr/bin/env bash
 
-fname=twitchbot.py
+# Copies the bot to the server. Changes to twitchbot/responses.json are picked up by the running
+# bot without a restart; changes to Python files need the bot to be restarted.
 
-ssh aws "mkdir -p tmp && tee tmp/$fname >/dev/null && sudo install -o twitchbot tmp/$fname /home/twitchbot/twitchbot/$fname" <$fname
+fnames="run.py twitchbot/__init__.py twitchbot/bot.py twitchbot/exn.py twitchbot/leaderboards.py twitchbot/responses.py twitchbot/responses.json"
+
+for fname in $fnames; do
+    ssh aws "mkdir -p tmp/twitchbot && tee tmp/$fname >/dev/null && sudo install -o twitchbot -D tmp/$fname /home/twitchbot/twitchbot/$fname" <$fname
+done
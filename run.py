@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
 
+import sys
+
 from twitchbot.bot import Bot
+from twitchbot.exn import ReloadError, log_error
 
 if __name__ == '__main__':
-    Bot().loop()
+    try:
+        bot = Bot()
+    except ReloadError as e:
+        log_error('Startup', e)
+        sys.exit(1)
+
+    bot.loop()
 
 
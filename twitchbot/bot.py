@@ -3,10 +3,12 @@ import ssl
 import time
 import traceback
 import heapq
+import signal
 
 from .secret import secret
 from .leaderboards import *
-from .exn import NetworkError, GetError
+from .responses import load_responses, responses_mtime
+from .exn import NetworkError, GetError, ReloadError, log_error
 
 """
 TODO:
@@ -41,6 +43,13 @@ PONG_MSG = 'PONG :tmi.twitch.tv'
 
 TIMEOUT_DISABLE_HOURS = 18
 
+RESPONSES_POLL_INTERVAL = 2
+
+# Commands handled in handle_commands; responses.json may not redefine these
+PYTHON_COMMANDS = frozenset({
+    'wr', 'rank', 'pb', 'latest', 'issrcdown', 'timeout', 'enabletimeout', 'disabletimeout', 'msg',
+})
+
 Timer = collections.namedtuple('Timer', ['interval', 'func'])
 
 
@@ -54,7 +63,11 @@ class Bot:
         self.timer_pqueue = []
         # How many times has each user tried to timeout someone else?
         self.user_timeouts = collections.defaultdict(int)
+        self.responses_mtime = responses_mtime()
+        self.responses = load_responses(reserved_names=PYTHON_COMMANDS)
+        self.reload_requested = False
         self.init_timers()
+        self.init_signals()
 
     def loop(self):
         while True:
@@ -63,9 +76,7 @@ class Bot:
                 self.provide_chatbot()
 
             except NetworkError as e:
-                print(f'Network error: {e.msg}')
-                if e.exn is not None:
-                    print(e.exn)
+                log_error('Network', e)
                 self.ssock.close()
 
                 print(f'Reconnecting in {RECONNECT_TIME} seconds')
@@ -77,6 +88,9 @@ class Bot:
 
     def provide_chatbot(self):
         while True:
+            if self.reload_requested:
+                self.reload_responses()
+
             msg = self.recv_raw()
             if msg is None:
                 self.handle_timers()
@@ -112,6 +126,37 @@ class Bot:
 
     def init_timers(self):
         self.add_timer_interval(PINGPONG_INTERVAL, self.ping_server)
+        self.add_timer_interval(RESPONSES_POLL_INTERVAL, self.check_responses)
+
+    def init_signals(self):
+        # `kill -HUP` reloads responses.json; only set a flag here so that a reload never
+        # interrupts a half-handled message
+        def request_reload(signum, frame):
+            self.reload_requested = True
+
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, request_reload)
+
+    def check_responses(self):
+        if responses_mtime() != self.responses_mtime:
+            self.reload_responses()
+
+    def reload_responses(self):
+        # Swap in freshly loaded responses; the connection, channels, and timers are untouched
+        self.reload_requested = False
+        self.responses_mtime = responses_mtime()
+        start = time.perf_counter()
+        try:
+            responses = load_responses(reserved_names=PYTHON_COMMANDS)
+        except ReloadError as e:
+            # Keep the old responses so that a typo doesn't take down every command; the next
+            # save of responses.json will trigger another attempt
+            log_error('Reload', e)
+            return
+
+        self.responses = responses
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f'Reloaded {len(responses.commands)} responses in {elapsed_ms:.1f} ms')
 
     def ping_server(self):
         self.send_raw('PING')
@@ -140,38 +185,16 @@ class Bot:
             task_func()
 
     def handle_porter(self, user, channel, message):
-        porter_references = [
-            'porter',
-            'robinson',
-            'shelter',
-            'sad machine',
-            'goodbye to a world',
-            'goodbye world',
-            'lionhearted',
-            'sea of voices',
-            'divinity',
-            'fellow feeling',
-            'flicker',
-            'fresh static snow',
-            'language',
-            'years of war',
-            'she heals everything',
-            'say my name',
-            'hear the bells',
-            'polygon dust',
-            'shepherdess',
-            'natural light',
-            'the thrill',
-            'madeon',
-            'anamanaguchi',
-            'kero kero bonito',
-            'your wish',
-        ]
-
-        inner_re = '|'.join(porter_references).lower()
-        phrases_re = r'(^|\W)({})($|\W)'.format(inner_re)
-        if re.search(phrases_re, message.lower()):
-            self.send_msg(channel, '【=◈︿◈=】')
+        if self.responses.porter_re.search(message.lower()):
+            self.send_msg(channel, self.responses.porter_reply)
+
+    def send_response(self, user, channel, response):
+        for i, msg in enumerate(response.messages):
+            msg = msg.format(user=user)
+            if i == 0 or response.spacing == 0:
+                self.send_msg(channel, msg)
+            else:
+                self.add_timer_oneshot(i * response.spacing, lambda msg=msg: self.send_msg(channel, msg))
 
     def handle_timeout(self, channel, user, args):
         if channel != MY_CHANNEL:
@@ -230,40 +253,13 @@ class Bot:
         cmd, args = cmd_match.group(1, 2)
         args = args.strip()
 
-        # TODO replace with hashmap if it gets too big
-        if (cmd in ['bot', 'help', 'commands'] and channel == MY_CHANNEL) or cmd == 'complexplanebot':
-            send_msg(
-                'I am a Twitch bot written in Python 3 by ComplexPlane. For a full list of commands: https://git.io/fj2gV')
+        response = self.responses.commands.get(cmd)
+        if response is not None and (response.shared or channel == MY_CHANNEL):
+            self.send_response(user, channel, response)
 
         elif cmd == 'wr' and channel == MY_CHANNEL:
             self.handle_commands(user, channel, '!1st')
 
-        elif cmd in ['social', 'links'] and channel == MY_CHANNEL:
-            send_msg('Twitter: https://twitter.com/ComplexPlaneRun')
-            self.add_timer_oneshot(1, lambda: send_msg('Discord: https://discord.gg/nJWndP5'))
-            self.add_timer_oneshot(2, lambda: send_msg('Youtube: https://bit.ly/2GbXGlD'))
-            self.add_timer_oneshot(3, lambda: send_msg('Speedrun.com: https://bit.ly/2NSTbCI'))
-            self.add_timer_oneshot(4, lambda: send_msg('Monkey Ball Community Discord: https://discord.gg/4TVgGkx'))
-            self.add_timer_oneshot(5, lambda: send_msg('Monkey Ball RTA-Focused Discord: https://discord.gg/N8N8Njc'))
-
-        elif cmd == 'schedule' and channel == MY_CHANNEL:
-            send_msg("I don't have a schedule currently.")
-
-        elif cmd == 'twitter' and channel == MY_CHANNEL:
-            send_msg('Twitter: https://twitter.com/ComplexPlaneRun')
-
-        elif cmd == 'discord' and channel == MY_CHANNEL:
-            send_msg('Discord: https://discord.gg/nJWndP5')
-
-        elif cmd == 'src' and channel == MY_CHANNEL:
-            send_msg('Speedrun.com: https://bit.ly/2NSTbCI')
-
-        elif cmd == 'gaming' and channel == MY_CHANNEL:
-            send_msg('https://clips.twitch.tv/YummyTenuousMouseCharlieBitMe')
-
-        elif cmd == 'slideintodms' and channel == MY_CHANNEL:
-            send_msg(f'/w {user} heyyy ;)')
-
         elif cmd in ['rank', 'pb']:
             send_msg(leaderboards_user_lookup(args))
 
@@ -276,32 +272,6 @@ class Bot:
             else:
                 send_msg('Speedrun.com appears to be DOWN.')
 
-        elif cmd == 'pausing':
-            send_msg(
-                'Pause strats are a way to perform perfectly precise movement on a stage. In Monkey Ball, there is zero RNG; if we provide exactly the same inputs on the control stick on exactly the same frames on a level, exactly the same thing will happen. To perform a pause strat, you hold the control stick in an exact direction (thanks to the Gamecube controller\'s notches), pause on a specific frame (using the timer as a reference), and repeat.')
-
-            send_msg(
-                'Often we will pause slightly before the intended frame and then press B quickly followed by Pause to advance a small number of frames until the desired frame is reached. Pausing quickly and frame-perfectly is tricky to do consistently, so many pause strats include "backup frames" as well.')
-
-        elif cmd == 'boosting':
-            send_msg(
-                'Switching between up-left and up-right can change your momentum in certain circumstances. Boosting once at the start of a level ("frame boosting") or into angled walls ("wall boosting") can give you a speed boost. Boosting in mid-air can keep you in the air for slightly longer ("air boosting").')
-
-        elif cmd == 'firstframe':
-            send_msg(
-                'The game does not consider the stage completed until the third frame after breaking the goaltape. Leaving the stage with "Stage Select" on the first two frames results in a "first frame".')
-
-        elif cmd == 'walls':
-            send_msg(
-                'For many kinds of walls, wall boosting gives an inconsistent amount of speed. Sometimes you can smoothly roll off of them, sometimes you can just bonk and gain less speed. This inconsistency can make certain strats not RTA-viable.')
-
-        elif cmd == 'alisters':
-            send_msg('Alisters Discord: https://discord.gg/N8N8Njc')
-
-        elif cmd == 'smh' and channel == MY_CHANNEL:
-            send_msg(
-                f'Hi, my name is {user} and you should follow me at twitch.tv/{user}  I\'m an epic speedrunner and MUCH better than this lowly gamer!!')
-
         elif cmd == 'timeout':
             self.handle_timeout(channel, user, args)
 
@@ -338,26 +308,6 @@ class Bot:
         elif cmd == 'msg' and channel == MY_CHANNEL:
             self.handle_msg_command(channel, user, args)
 
-        elif channel == MY_CHANNEL and cmd == 'surgery':
-            send_msg('https://www.youtube.com/watch?v=DywNCzt_ky8')
-
-        elif channel == MY_CHANNEL and cmd == 'peplane':
-            send_msg('On December 27, 2020, myself + PetresInc (Peplane) tied the SMAL world record with two 28:17s!')
-
-        elif channel == MY_CHANNEL and cmd in ['timesave', 'timesaves']:
-            send_msg('~6s on Spinning Top (failed 2nd frame, retry) ~0.75s on Stepping Stones (too far left before first stepping stone, speed bump, got clip) ~3s on Giant Comb (idk how I failed this) ~0.2s on Beehive (slow Alist Beehive) ~0.4s on Arthropod (went off a little early so did slow ending) ~0.5s on Seesaw Bridges (got 33.63, slow first clip and wide first turn on last seesaw)')
-            send_msg('~0.6s on Fluctuation (bad bounce pattern) ~0.2s on Punched Seesaws (too deep clip) ~1s on Folders (if I get 49 Folders) ~0.5s on Sieve (with faster pausing and faster goal entry) ~8s on Momentum (death) ~1.1s on Swing Shaft (missed frame)')
-            send_msg('~1.3s on Guillotine (slow pausing) ~0.2s on Twin Basin (too deep clip) ~2s on Corkscrew (goal bonk) ~6.3s on Gimmick (missed frame) ~0.6s on Postmodern (repause at goal) ~0.5s on Invisible (missed retry) ~0.5s on Created By (slow adjustment)')
-            
-        elif channel == MY_CHANNEL and cmd == '1080p':
-            send_msg('I\'m testing streaming at 1080p 60FPS, primarily so that local recordings are also 1080p. If you notice any frame drops, blurriness, or trouble watching the stream even at lower quality options, let me know!')
-
-        elif channel == MY_CHANNEL and cmd == 'iws':
-            send_msg('How many attempts does it take for me to complete an individual world deathless? https://docs.google.com/spreadsheets/d/1EcrM4PHhiGH3CB7R9fYjrXLgkKD1IayUMyeqPDBKBm0/edit?usp=sharing')
-
-        elif channel == MY_CHANNEL and cmd == 'tryhard':
-            send_msg('To help focus, I will be hiding splits after W1 and hiding chat after W3. Wish me luck!')
-
         else:
             leaderboards_msg = leaderboards_rank_lookup(cmd)
             if leaderboards_msg:
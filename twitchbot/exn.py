@@ -7,3 +7,15 @@ class NetworkError(Exception):
 class GetError(Exception):
     def __init__(self, msg):
         self.msg = msg
+
+
+class ReloadError(Exception):
+    def __init__(self, msg, exn=None):
+        self.msg = msg
+        self.exn = exn
+
+
+def log_error(kind, e):
+    print(f'{kind} error: {e.msg}')
+    if e.exn is not None:
+        print(repr(e.exn))
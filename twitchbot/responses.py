@@ -0,0 +1,92 @@
+import collections
+import json
+import os
+import re
+
+from .exn import ReloadError
+
+# Static command replies and other chat content, editable without restarting the bot
+RESPONSES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'responses.json')
+
+# `spacing` is the number of seconds between consecutive messages (0 sends them all at once)
+Response = collections.namedtuple('Response', ['messages', 'shared', 'spacing'])
+
+Responses = collections.namedtuple('Responses', ['commands', 'porter_re', 'porter_reply'])
+
+
+def _check_str_list(value, what):
+    if not isinstance(value, list) or len(value) == 0:
+        raise ValueError(f'{what} must be a non-empty list')
+    for item in value:
+        if not isinstance(item, str) or item == '':
+            raise ValueError(f'{what} must only contain non-empty strings, got {item!r}')
+
+
+def _parse_response(entry):
+    names = entry['names']
+    _check_str_list(names, 'Command names')
+
+    messages = entry['messages']
+    _check_str_list(messages, f'Messages of {names}')
+
+    # Catch bad placeholders now rather than when somebody uses the command
+    for msg in messages:
+        msg.format(user='')
+
+    shared = entry.get('shared', False)
+    if not isinstance(shared, bool):
+        raise ValueError(f'shared of {names} must be true or false, got {shared!r}')
+
+    spacing = entry.get('spacing', 0)
+    if isinstance(spacing, bool) or not isinstance(spacing, (int, float)) or spacing < 0:
+        raise ValueError(f'spacing of {names} must be a non-negative number, got {spacing!r}')
+
+    return Response(
+        messages=tuple(messages),
+        shared=shared,
+        spacing=spacing,
+    )
+
+
+def load_responses(path=RESPONSES_PATH, reserved_names=frozenset()):
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        commands = {}
+        for entry in data['commands']:
+            response = _parse_response(entry)
+            for name in entry['names']:
+                # Commands are parsed with `^!([^ ]+)`, so these names could never be used
+                if ' ' in name or name.startswith('!'):
+                    raise ValueError(f'Invalid command name {name!r}')
+                if name in reserved_names:
+                    raise ValueError(f'Command !{name} is already implemented by the bot')
+                if name in commands:
+                    raise ValueError(f'Command !{name} is defined more than once')
+                commands[name] = response
+
+        porter_references = data['porter_references']
+        _check_str_list(porter_references, 'porter_references')
+        porter_reply = data['porter_reply']
+        if not isinstance(porter_reply, str) or porter_reply == '':
+            raise ValueError(f'porter_reply must be a non-empty string, got {porter_reply!r}')
+
+        inner_re = '|'.join(map(re.escape, porter_references)).lower()
+        porter_re = re.compile(r'(^|\W)({})($|\W)'.format(inner_re))
+
+        return Responses(
+            commands=commands,
+            porter_re=porter_re,
+            porter_reply=porter_reply,
+        )
+
+    except Exception as e:
+        raise ReloadError(f'Failed to load responses from {path}', e)
+
+
+def responses_mtime(path=RESPONSES_PATH):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None